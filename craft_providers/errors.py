@@ -40,18 +40,17 @@ def details_from_command_error(
     """
     cmd_string = shlex.join(cmd)
 
-    details = [
-        f"* Command that failed: {cmd_string!r}",
-        f"* Command exit code: {returncode}",
-    ]
+    details = (
+        f"* Command that failed: {cmd_string!r}\n* Command exit code: {returncode}"
+    )
 
     if stdout:
-        details.append(f"* Command output: {stdout!r}")
+        details += f"\n* Command output: {stdout!r}"
 
     if stderr:
-        details.append(f"* Command standard error output: {stderr!r}")
+        details += f"\n* Command standard error output: {stderr!r}"
 
-    return "\n".join(details)
+    return details
 
 
 def details_from_called_process_error(
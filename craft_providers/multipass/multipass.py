@@ -54,7 +54,8 @@ class Multipass:
         """Execute command in instance_name, allowing output to console."""
         command = [str(self.multipass_path), *command]
 
-        logger.debug("Executing on host: %s", shlex.join(command))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing on host: %s", shlex.join(command))
         return subprocess.run(command, check=check, **kwargs)
 
     def delete(self, *, instance_name: str, purge=True) -> None:
@@ -95,8 +96,8 @@ class Multipass:
         """
         final_cmd = [str(self.multipass_path), "exec", instance_name, "--", *command]
 
-        quoted_final_cmd = shlex.join(final_cmd)
-        logger.debug("Executing on host: %s", quoted_final_cmd)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing on host: %s", shlex.join(final_cmd))
 
         return runner(final_cmd, **kwargs)  # pylint: disable=subprocess-run-check
 
@@ -174,7 +175,7 @@ class Multipass:
                 details=errors.details_from_called_process_error(error),
             ) from error
 
-        data_list = json.loads(proc.stdout).get("list", dict())
+        data_list = json.loads(proc.stdout).get("list", [])
         return [instance["name"] for instance in data_list]
 
     def mount(
@@ -57,6 +57,8 @@ EXAMPLE_INFO = """\
 }
 """
 
+EXAMPLE_INFO_DATA = json.loads(EXAMPLE_INFO)
+
 EXAMPLE_LIST = """\
 {
     "list": [
@@ -79,6 +81,8 @@ EXAMPLE_LIST = """\
 }
 """
 
+PROJECT_PATH = pathlib.Path.home() / "my-project"
+
 
 @pytest.fixture
 def mock_details_from_process_error():
@@ -100,26 +104,24 @@ def mock_details_from_command_error():
         yield mock_details
 
 
-def test_delete(fake_process):
-    fake_process.register_subprocess(["multipass", "delete", "test-instance"])
+def test_delete(fp):
+    fp.register(["multipass", "delete", "test-instance"])
 
     Multipass().delete(instance_name="test-instance", purge=False)
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_delete_purge(fake_process):
-    fake_process.register_subprocess(
-        ["multipass", "delete", "test-instance", "--purge"]
-    )
+def test_delete_purge(fp):
+    fp.register(["multipass", "delete", "test-instance", "--purge"])
 
     Multipass().delete(instance_name="test-instance", purge=True)
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_delete_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
+def test_delete_error(fp, mock_details_from_process_error):
+    fp.register(
         ["multipass", "delete", "test-instance", "--purge"],
         returncode=1,
     )
@@ -133,18 +135,16 @@ def test_delete_error(fake_process, mock_details_from_process_error):
     )
 
 
-def test_exec(fake_process):
-    fake_process.register_subprocess(
-        ["multipass", "exec", "test-instance", "--", "sleep", "1"]
-    )
+def test_exec(fp):
+    fp.register(["multipass", "exec", "test-instance", "--", "sleep", "1"])
 
     Multipass().exec(command=["sleep", "1"], instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_exec_error_no_check(fake_process):
-    fake_process.register_subprocess(
+def test_exec_error_no_check(fp):
+    fp.register(
         ["multipass", "exec", "test-instance", "--", "false"],
         returncode=1,
     )
@@ -154,8 +154,8 @@ def test_exec_error_no_check(fake_process):
     assert proc.returncode == 1
 
 
-def test_exec_error_with_check(fake_process):
-    fake_process.register_subprocess(
+def test_exec_error_with_check(fp):
+    fp.register(
         ["multipass", "exec", "test-instance", "--", "false"],
         returncode=1,
     )
@@ -164,19 +164,19 @@ def test_exec_error_with_check(fake_process):
         Multipass().exec(command=["false"], instance_name="test-instance", check=True)
 
 
-def test_info(fake_process):
-    fake_process.register_subprocess(
+def test_info(fp):
+    fp.register(
         ["multipass", "info", "test-instance", "--format", "json"], stdout=EXAMPLE_INFO
     )
 
     data = Multipass().info(instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
-    assert data == json.loads(EXAMPLE_INFO)
+    assert len(fp.calls) == 1
+    assert data == EXAMPLE_INFO_DATA
 
 
-def test_info_no_vm(fake_process):
-    fake_process.register_subprocess(
+def test_info_no_vm(fp):
+    fp.register(
         ["multipass", "info", "test-instance", "--format", "json"],
         stderr='info failed: The following errors occurred:\ninstance "foo" does not exist',
         returncode=1,
@@ -184,37 +184,35 @@ def test_info_no_vm(fake_process):
 
     data = Multipass().info(instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert data is None
 
 
-def test_info_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
+def test_info_error(fp, mock_details_from_process_error):
+    fp.register(
         ["multipass", "info", "test-instance", "--format", "json"], returncode=1
     )
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().info(instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
         brief="Failed to query info for VM 'test-instance'.",
         details=mock_details_from_process_error.return_value,
     )
 
 
-def test_launch(fake_process):
-    fake_process.register_subprocess(
-        ["multipass", "launch", "test-image", "--name", "test-instance"]
-    )
+def test_launch(fp):
+    fp.register(["multipass", "launch", "test-image", "--name", "test-instance"])
 
     Multipass().launch(image="test-image", instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_launch_all_opts(fake_process):
-    fake_process.register_subprocess(
+def test_launch_all_opts(fp):
+    fp.register(
         [
             "multipass",
             "launch",
@@ -238,73 +236,65 @@ def test_launch_all_opts(fake_process):
         disk="80G",
     )
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_launch_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
+def test_launch_error(fp, mock_details_from_process_error):
+    fp.register(
         ["multipass", "launch", "test-image", "--name", "test-instance"], returncode=1
     )
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().launch(instance_name="test-instance", image="test-image")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
         brief="Failed to launch VM 'test-instance'.",
         details=mock_details_from_process_error.return_value,
     )
 
 
-def test_list(fake_process):
-    fake_process.register_subprocess(
-        ["multipass", "list", "--format", "json"], stdout=EXAMPLE_LIST
-    )
+def test_list(fp):
+    fp.register(["multipass", "list", "--format", "json"], stdout=EXAMPLE_LIST)
 
     vm_list = Multipass().list()
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert vm_list == ["manageable-snipe", "flowing-hawfinch"]
 
 
-def test_list_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
-        ["multipass", "list", "--format", "json"], returncode=1
-    )
+def test_list_error(fp, mock_details_from_process_error):
+    fp.register(["multipass", "list", "--format", "json"], returncode=1)
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().list()
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
         brief="Failed to query list of VMs.",
         details=mock_details_from_process_error.return_value,
     )
 
 
-def test_mount(fake_process):
-    project_path = pathlib.Path.home() / "my-project"
-    fake_process.register_subprocess(
-        ["multipass", "mount", str(project_path), "test-instance:/mnt"]
-    )
+def test_mount(fp):
+    fp.register(["multipass", "mount", str(PROJECT_PATH), "test-instance:/mnt"])
 
     Multipass().mount(
-        source=project_path,
+        source=PROJECT_PATH,
         target="test-instance:/mnt",
         uid_map=None,
         gid_map=None,
     )
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_mount_all_opts(fake_process):
-    project_path = pathlib.Path.home() / "my-project"
-    fake_process.register_subprocess(
+def test_mount_all_opts(fp):
+    fp.register(
         [
             "multipass",
             "mount",
-            str(project_path),
+            str(PROJECT_PATH),
             "test-instance:/mnt",
             "--uid-map",
             "1:2",
@@ -318,119 +308,110 @@ def test_mount_all_opts(fake_process):
     )
 
     Multipass().mount(
-        source=project_path,
+        source=PROJECT_PATH,
         target="test-instance:/mnt",
         uid_map={"1": "2", "3": "4"},
         gid_map={"5": "6", "7": "8"},
     )
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_mount_error(fake_process, mock_details_from_process_error):
-    project_path = pathlib.Path.home() / "my-project"
-    fake_process.register_subprocess(
-        ["multipass", "mount", str(project_path), "test-instance:/mnt"],
+def test_mount_error(fp, mock_details_from_process_error):
+    fp.register(
+        ["multipass", "mount", str(PROJECT_PATH), "test-instance:/mnt"],
         returncode=1,
     )
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().mount(
-            source=project_path,
+            source=PROJECT_PATH,
             target="test-instance:/mnt",
         )
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
-        brief=f"Failed to mount {str(project_path)!r} to 'test-instance:/mnt'.",
+        brief=f"Failed to mount {str(PROJECT_PATH)!r} to 'test-instance:/mnt'.",
         details=mock_details_from_process_error.return_value,
     )
 
 
-def test_start(fake_process):
-    fake_process.register_subprocess(["multipass", "start", "test-instance"])
+def test_start(fp):
+    fp.register(["multipass", "start", "test-instance"])
 
     Multipass().start(instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_start_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
-        ["multipass", "start", "test-instance"], returncode=1
-    )
+def test_start_error(fp, mock_details_from_process_error):
+    fp.register(["multipass", "start", "test-instance"], returncode=1)
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().start(instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
         brief="Failed to start VM 'test-instance'.",
         details=mock_details_from_process_error.return_value,
     )
 
 
-def test_stop(fake_process):
-    fake_process.register_subprocess(["multipass", "stop", "test-instance"])
+def test_stop(fp):
+    fp.register(["multipass", "stop", "test-instance"])
 
     Multipass().stop(instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_stop_all_opts(fake_process):
-    fake_process.register_subprocess(
-        ["multipass", "stop", "--time", "5", "test-instance"]
-    )
+def test_stop_all_opts(fp):
+    fp.register(["multipass", "stop", "--time", "5", "test-instance"])
 
     Multipass().stop(instance_name="test-instance", delay_mins=5)
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_stop_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
-        ["multipass", "stop", "test-instance"], returncode=1
-    )
+def test_stop_error(fp, mock_details_from_process_error):
+    fp.register(["multipass", "stop", "test-instance"], returncode=1)
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().stop(instance_name="test-instance")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
         brief="Failed to stop VM 'test-instance'.",
         details=mock_details_from_process_error.return_value,
     )
 
 
-def test_transfer(fake_process):
-    fake_process.register_subprocess(
-        ["multipass", "transfer", "test-instance:/test1", "/test2"]
-    )
+def test_transfer(fp):
+    fp.register(["multipass", "transfer", "test-instance:/test1", "/test2"])
 
     Multipass().transfer(source="test-instance:/test1", destination="/test2")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_transfer_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
+def test_transfer_error(fp, mock_details_from_process_error):
+    fp.register(
         ["multipass", "transfer", "test-instance:/test1", "/test2"], returncode=1
     )
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().transfer(source="test-instance:/test1", destination="/test2")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
         brief="Failed to transfer 'test-instance:/test1' to '/test2'.",
         details=mock_details_from_process_error.return_value,
     )
 
 
-def test_transfer_destination_io(fake_process):
+def test_transfer_destination_io(fp):
     stream = mock.Mock()
-    fake_process.register_subprocess(
+    fp.register(
         ["multipass", "transfer", "test-instance:/test1", "-"], stdout=b"Hello World!\n"
     )
 
@@ -438,13 +419,13 @@ def test_transfer_destination_io(fake_process):
         source="test-instance:/test1", destination=stream
     )
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert stream.mock_calls == [mock.call.write(b"Hello World!\n")]
 
 
-def test_transfer_destination_io_chunk_size(fake_process):
+def test_transfer_destination_io_chunk_size(fp):
     stream = mock.Mock()
-    fake_process.register_subprocess(
+    fp.register(
         ["multipass", "transfer", "test-instance:/test1", "-"], stdout=b"Hello World!\n"
     )
 
@@ -452,7 +433,7 @@ def test_transfer_destination_io_chunk_size(fake_process):
         source="test-instance:/test1", destination=stream, chunk_size=4
     )
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert stream.mock_calls == [
         mock.call.write(b"Hell"),
         mock.call.write(b"o Wo"),
@@ -572,23 +553,21 @@ def test_transfer_source_io_error(mock_popen, mock_details_from_command_error):
     ]
 
 
-def test_umount(fake_process):
-    fake_process.register_subprocess(["multipass", "umount", "test-instance:/mnt"])
+def test_umount(fp):
+    fp.register(["multipass", "umount", "test-instance:/mnt"])
 
     Multipass().umount(mount="test-instance:/mnt")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
 
 
-def test_umount_error(fake_process, mock_details_from_process_error):
-    fake_process.register_subprocess(
-        ["multipass", "umount", "test-instance:/mnt"], returncode=1
-    )
+def test_umount_error(fp, mock_details_from_process_error):
+    fp.register(["multipass", "umount", "test-instance:/mnt"], returncode=1)
 
     with pytest.raises(MultipassError) as exc_info:
         Multipass().umount(mount="test-instance:/mnt")
 
-    assert len(fake_process.calls) == 1
+    assert len(fp.calls) == 1
     assert exc_info.value == MultipassError(
         brief="Failed to unmount 'test-instance:/mnt'.",
         details=mock_details_from_process_error.return_value,